@@ -9,7 +9,7 @@ from awswrangler.s3._merge_upsert_table import merge_upsert_table  # noqa
 from awswrangler.s3._read_excel import read_excel  # noqa
 from awswrangler.s3._read_parquet import read_parquet, read_parquet_metadata, read_parquet_table  # noqa
 from awswrangler.s3._read_text import read_csv, read_fwf, read_json  # noqa
-from awswrangler.s3._select import select_query
+from awswrangler.s3._select import select_query, select_query_arrow
 from awswrangler.s3._upload import upload  # noqa
 from awswrangler.s3._wait import wait_objects_exist, wait_objects_not_exist  # noqa
 from awswrangler.s3._write_excel import to_excel  # noqa
@@ -36,6 +36,7 @@ __all__ = [
     "wait_objects_exist",
     "wait_objects_not_exist",
     "select_query",
+    "select_query_arrow",
     "store_parquet_metadata",
     "to_parquet",
     "to_csv",
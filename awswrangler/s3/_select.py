@@ -1,85 +1,250 @@
 """Amazon S3 Select Module (PRIVATE)."""
 
 import concurrent.futures
-import itertools
 import json
 import logging
+import os
 import pprint
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import boto3
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json
+from botocore.config import Config
 
-from awswrangler import _utils, exceptions
-from awswrangler.s3._describe import size_objects
+from awswrangler import _config, _utils, exceptions
+from awswrangler.s3 import _fs
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
-_RANGE_CHUNK_SIZE: int = int(1024 * 1024)
+_RANGE_CHUNK_SIZE: int = int(16 * 1024 * 1024)
+_MAX_RANGE_CHUNK_SIZE: int = int(64 * 1024 * 1024)
+_JSON_BLOCK_SIZE: int = int(8 * 1024 * 1024)
+_MIN_POOL_CONNECTIONS: int = 50
 
 
-def _gen_scan_range(obj_size: int) -> Iterator[Tuple[int, int]]:
-    for i in range(0, obj_size, _RANGE_CHUNK_SIZE):
-        yield (i, i + min(_RANGE_CHUNK_SIZE, obj_size - i))
+def _select_botocore_config(cpus: int) -> Config:
+    global_config: Optional[Config] = _config.config.botocore_config
+    config_kwargs: Dict[str, Any] = {"max_pool_connections": max(cpus, _MIN_POOL_CONNECTIONS)}
+    # Retries configured through wr.config or the environment are honoured like in every other client
+    if global_config is None and os.getenv("AWS_MAX_ATTEMPTS") is None and os.getenv("AWS_RETRY_MODE") is None:
+        config_kwargs["retries"] = {"max_attempts": 10, "mode": "adaptive"}
+    if "tcp_keepalive" in Config.OPTION_DEFAULTS:  # Not available in older botocore releases
+        config_kwargs["tcp_keepalive"] = True
+    return (global_config or _utils.default_botocore_config()).merge(Config(**config_kwargs))
+
+
+def _s3_client(boto3_session: Optional[boto3.Session], botocore_config: Optional[Config]) -> boto3.client:
+    if botocore_config is None:  # Left out so the global wr.config.botocore_config still applies
+        return _utils.client(service_name="s3", session=boto3_session)
+    return _utils.client(service_name="s3", session=boto3_session, botocore_config=botocore_config)
+
+
+def _gen_scan_range(
+    obj_size: int, scan_range_chunk_size: Optional[int] = None, workers: int = 1
+) -> Iterator[Tuple[int, int]]:
+    chunk_size: int = scan_range_chunk_size or max(
+        _RANGE_CHUNK_SIZE, min(_MAX_RANGE_CHUNK_SIZE, obj_size // max(workers, 1))
+    )
+    # S3 Select processes whole records starting within each scan range, so records are never split across ranges.
+    # ScanRange End is inclusive, so consecutive ranges must not share their boundary byte
+    for i in range(0, obj_size, chunk_size):
+        yield (i, min(i + chunk_size, obj_size) - 1)
 
 
 def _select_object_content(
     args: Dict[str, Any],
-    boto3_session: Optional[boto3.Session],
+    client_s3: boto3.client,
     scan_range: Optional[Tuple[int, int]] = None,
-) -> List[Dict[str, Any]]:
-    client_s3: boto3.client = _utils.client(service_name="s3", session=boto3_session)
-
+) -> List[bytes]:
     if scan_range:
         response = client_s3.select_object_content(**args, ScanRange={"Start": scan_range[0], "End": scan_range[1]})
     else:
         response = client_s3.select_object_content(**args)
 
-    payload_records = []
-    partial_record: str = ""
-    for event in response["Payload"]:
-        if "Records" in event:
-            records = event["Records"]["Payload"].decode(encoding="utf-8", errors="ignore").split("\n")
-            records[0] = partial_record + records[0]
-            # Record end can either be a partial record or a return char
-            partial_record = records.pop()
-            payload_records.extend([json.loads(record) for record in records])
-    return payload_records
+    # Raw event payloads are kept as is and only copied once, into the buffer parsed by Arrow
+    return [event["Records"]["Payload"] for event in response["Payload"] if "Records" in event]
+
+
+def _read_json(buffer: pa.Buffer, explicit_schema: Optional[pa.Schema], use_threads: Union[bool, int]) -> pa.Table:
+    if buffer.size == 0:
+        return pa.table({}) if explicit_schema is None else explicit_schema.empty_table()
+    read_options: pyarrow.json.ReadOptions = pyarrow.json.ReadOptions(
+        use_threads=_utils.ensure_cpu_count(use_threads=use_threads) > 1, block_size=_JSON_BLOCK_SIZE
+    )
+    # JSON LINES records from all scan ranges are parsed in a single pass by Arrow's C++ reader,
+    # so column types are resolved across the whole object (e.g. int64 promoted to double).
+    # S3 Select escapes newlines inside values, so blocks can be split on any newline and parsed in parallel
+    table: pa.Table = pyarrow.json.read_json(
+        pa.BufferReader(buffer),
+        read_options=read_options,
+        parse_options=pyarrow.json.ParseOptions(
+            explicit_schema=explicit_schema, newlines_in_values=False, unexpected_field_behavior="infer"
+        ),
+    )
+    if explicit_schema is None and any(pa.types.is_timestamp(field.type) for field in table.schema):
+        # Arrow infers ISO-8601 looking strings (e.g. "2020-01-01") as timestamps. S3 Select only returns them
+        # as JSON strings, so those columns are parsed again as strings to keep the original values
+        table = pyarrow.json.read_json(
+            pa.BufferReader(buffer),
+            read_options=read_options,
+            parse_options=pyarrow.json.ParseOptions(
+                explicit_schema=pa.schema(
+                    [
+                        field.with_type(pa.string()) if pa.types.is_timestamp(field.type) else field
+                        for field in table.schema
+                    ]
+                ),
+                newlines_in_values=False,
+                unexpected_field_behavior="infer",
+            ),
+        )
+    return table
+
+
+def _table_to_df(table: pa.Table, use_threads: Union[bool, int]) -> pd.DataFrame:
+    if table.num_columns == 0:
+        return pd.DataFrame()
+    if type(use_threads) == int:  # pylint: disable=unidiomatic-typecheck
+        use_threads = bool(use_threads > 1)
+    # One contiguous chunk per column lets to_pandas build a single block per column
+    return _utils.ensure_df_is_mutable(
+        df=table.combine_chunks().to_pandas(
+            use_threads=use_threads,
+            split_blocks=True,
+            self_destruct=True,
+            ignore_metadata=True,
+        )
+    )
 
 
 def _paginate_stream(
-    args: Dict[str, Any], path: str, use_threads: Union[bool, int], boto3_session: Optional[boto3.Session]
-) -> pd.DataFrame:
-    obj_size: int = size_objects(  # type: ignore
-        path=[path],
-        use_threads=False,
-        boto3_session=boto3_session,
-    ).get(path)
+    args: Dict[str, Any],
+    path: str,
+    use_threads: Union[bool, int],
+    boto3_session: Optional[boto3.Session],
+    scan_range_chunk_size: Optional[int] = None,
+    botocore_config: Optional[Config] = None,
+) -> Iterator[List[bytes]]:
+    cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
+    if use_threads is False:
+        client_s3: boto3.client = _s3_client(boto3_session=boto3_session, botocore_config=botocore_config)
+    else:
+        # A single client is shared across threads, sized so every worker gets its own connection
+        client_s3 = _s3_client(
+            boto3_session=boto3_session, botocore_config=botocore_config or _select_botocore_config(cpus=cpus)
+        )
+    # The object size is fetched with the same client (and SSE-C headers) used for the scan ranges
+    obj_size: Optional[int] = _utils.try_it(
+        f=client_s3.head_object,
+        ex=client_s3.exceptions.NoSuchKey,
+        **_fs.get_botocore_valid_kwargs(function_name="head_object", s3_additional_kwargs=args),
+    ).get("ContentLength")
     if obj_size is None:
         raise exceptions.InvalidArgumentValue(f"S3 object w/o defined size: {path}")
-    scan_ranges = _gen_scan_range(obj_size=obj_size)
+    scan_ranges: List[Tuple[int, int]] = list(
+        _gen_scan_range(obj_size=obj_size, scan_range_chunk_size=scan_range_chunk_size, workers=cpus)
+    )
 
-    if use_threads is False:
-        stream_records = list(
-            _select_object_content(
-                args=args,
-                boto3_session=boto3_session,
-                scan_range=scan_range,
-            )
-            for scan_range in scan_ranges
-        )
+    if len(scan_ranges) < 2:  # Small objects are queried whole in a single request
+        yield _select_object_content(args=args, client_s3=client_s3)
+    elif use_threads is False:
+        for scan_range in scan_ranges:
+            yield _select_object_content(args=args, client_s3=client_s3, scan_range=scan_range)
     else:
-        cpus: int = _utils.ensure_cpu_count(use_threads=use_threads)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=cpus) as executor:
-            stream_records = list(
-                executor.map(
-                    _select_object_content,
-                    itertools.repeat(args),
-                    itertools.repeat(boto3_session),
-                    scan_ranges,
+        # No more threads than scan ranges are spawned for small objects
+        workers: int = min(cpus, len(scan_ranges))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # At most two scan ranges per worker are in flight. This bounds the outstanding requests and the results
+            # completed out of order, not the overall memory: every result is still appended to the single buffer
+            # parsed by Arrow. The peak is roughly the raw JSON of the whole result (kept by select_query for its
+            # record by record fallback), the parsed table and, for DataFrames, its combine_chunks and to_pandas copies
+            futures: Deque[Any] = deque()
+            for scan_range in scan_ranges:
+                if len(futures) >= 2 * workers:
+                    yield futures.popleft().result()
+                futures.append(
+                    executor.submit(_select_object_content, args=args, client_s3=client_s3, scan_range=scan_range)
                 )
-            )
-    return pd.DataFrame([item for sublist in stream_records for item in sublist])  # Flatten list of lists
+            while futures:
+                yield futures.popleft().result()
+
+
+def _select_query(
+    sql: str,
+    path: str,
+    input_serialization: str,
+    input_serialization_params: Dict[str, Union[bool, str]],
+    compression: Optional[str] = None,
+    scan_range_chunk_size: Optional[int] = None,
+    explicit_schema: Optional[pa.Schema] = None,
+    use_threads: Union[bool, int] = False,
+    boto3_session: Optional[boto3.Session] = None,
+    s3_additional_kwargs: Optional[Dict[str, Any]] = None,
+) -> pa.Buffer:
+    if path.endswith("/"):
+        raise exceptions.InvalidArgumentValue("<path> argument should be an S3 key, not a prefix.")
+    if input_serialization not in ["CSV", "JSON", "Parquet"]:
+        raise exceptions.InvalidArgumentValue("<input_serialization> argument must be 'CSV', 'JSON' or 'Parquet'")
+    if compression not in [None, "gzip", "bzip2"]:
+        raise exceptions.InvalidCompression(f"Invalid {compression} compression, please use None, 'gzip' or 'bzip2'.")
+    if compression and (input_serialization not in ["CSV", "JSON"]):
+        raise exceptions.InvalidArgumentCombination(
+            "'gzip' or 'bzip2' are only valid for input 'CSV' or 'JSON' objects."
+        )
+    if scan_range_chunk_size is not None and scan_range_chunk_size <= 0:
+        raise exceptions.InvalidArgumentValue("<scan_range_chunk_size> argument must be a positive number of bytes.")
+    bucket, key = _utils.parse_path(path)
+
+    args: Dict[str, Any] = {
+        "Bucket": bucket,
+        "Key": key,
+        "Expression": sql,
+        "ExpressionType": "SQL",
+        "RequestProgress": {"Enabled": False},
+        "InputSerialization": {
+            input_serialization: input_serialization_params,
+            "CompressionType": compression.upper() if compression else "NONE",
+        },
+        "OutputSerialization": {
+            "JSON": {},
+        },
+    }
+    botocore_config: Optional[Config] = None
+    if s3_additional_kwargs:
+        s3_additional_kwargs = s3_additional_kwargs.copy()
+        botocore_config = s3_additional_kwargs.pop("botocore_config", None)
+        args.update(s3_additional_kwargs)
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("args:\n%s", pprint.pformat(args))
+
+    if any(
+        [
+            compression,
+            input_serialization_params.get("AllowQuotedRecordDelimiter"),
+            input_serialization_params.get("Type") == "Document",
+        ]
+    ):  # Scan range is only supported for uncompressed CSV/JSON, CSV (without quoted delimiters)
+        # and JSON objects (in LINES mode only)
+        _logger.debug("Scan ranges are not supported given provided input.")
+        client_s3: boto3.client = _s3_client(boto3_session=boto3_session, botocore_config=botocore_config)
+        payloads: Iterable[List[bytes]] = [_select_object_content(args=args, client_s3=client_s3)]
+    else:
+        payloads = _paginate_stream(
+            args=args,
+            path=path,
+            use_threads=use_threads,
+            boto3_session=boto3_session,
+            scan_range_chunk_size=scan_range_chunk_size,
+            botocore_config=botocore_config,
+        )
+    sink: pa.BufferOutputStream = pa.BufferOutputStream()
+    for events in payloads:
+        for payload in events:
+            sink.write(payload)
+    return sink.getvalue()
 
 
 def select_query(
@@ -88,6 +253,8 @@ def select_query(
     input_serialization: str,
     input_serialization_params: Dict[str, Union[bool, str]],
     compression: Optional[str] = None,
+    scan_range_chunk_size: Optional[int] = None,
+    explicit_schema: Optional[pa.Schema] = None,
     use_threads: Union[bool, int] = False,
     boto3_session: Optional[boto3.Session] = None,
     s3_additional_kwargs: Optional[Dict[str, Any]] = None,
@@ -112,16 +279,27 @@ def select_query(
     compression: Optional[str]
         Compression type of the S3 object.
         Valid values: None, "gzip", or "bzip2". gzip and bzip2 are only valid for CSV and JSON objects.
+    scan_range_chunk_size: Optional[int]
+        Chunk size in bytes used to split the S3 object into scan ranges.
+        If None, it is derived from the object size and the number of threads (between 16 MiB and 64 MiB).
+        Must be greater than 0.
+    explicit_schema: Optional[pyarrow.Schema]
+        Schema of the records returned by the query (e.g. pyarrow.schema([("c0", pyarrow.int64())])).
+        If None, column types are inferred by Arrow across all returned records and ISO-8601 looking strings
+        (e.g. "2020-01-01") are kept as strings, e.g. pass pyarrow.timestamp("s") to parse them as timestamps.
     use_threads : Union[bool, int]
         True to enable concurrent requests, False to disable multiple threads.
         If enabled os.cpu_count() is used as the max number of threads.
         If integer is provided, specified number is used.
+        Scan ranges are I/O bound, so an integer above os.cpu_count() can be used to run more of them concurrently.
     boto3_session : boto3.Session(), optional
         Boto3 Session. The default boto3 session is used if none is provided.
     s3_additional_kwargs : Optional[Dict[str, Any]]
         Forwarded to botocore requests.
         Valid values: "SSECustomerAlgorithm", "SSECustomerKey", "ExpectedBucketOwner".
         e.g. s3_additional_kwargs={'SSECustomerAlgorithm': 'md5'}
+        A "botocore_config" key holding a botocore.config.Config overrides the configuration
+        of the S3 client used to issue the requests.
 
     Returns
     -------
@@ -166,44 +344,81 @@ def select_query(
     ...     input_serialization='Parquet',
     ... )
     """
-    if path.endswith("/"):
-        raise exceptions.InvalidArgumentValue("<path> argument should be an S3 key, not a prefix.")
-    if input_serialization not in ["CSV", "JSON", "Parquet"]:
-        raise exceptions.InvalidArgumentValue("<input_serialization> argument must be 'CSV', 'JSON' or 'Parquet'")
-    if compression not in [None, "gzip", "bzip2"]:
-        raise exceptions.InvalidCompression(f"Invalid {compression} compression, please use None, 'gzip' or 'bzip2'.")
-    if compression and (input_serialization not in ["CSV", "JSON"]):
-        raise exceptions.InvalidArgumentCombination(
-            "'gzip' or 'bzip2' are only valid for input 'CSV' or 'JSON' objects."
-        )
-    bucket, key = _utils.parse_path(path)
+    buffer: pa.Buffer = _select_query(
+        sql=sql,
+        path=path,
+        input_serialization=input_serialization,
+        input_serialization_params=input_serialization_params,
+        compression=compression,
+        scan_range_chunk_size=scan_range_chunk_size,
+        explicit_schema=explicit_schema,
+        use_threads=use_threads,
+        boto3_session=boto3_session,
+        s3_additional_kwargs=s3_additional_kwargs,
+    )
+    try:
+        table: pa.Table = _read_json(buffer=buffer, explicit_schema=explicit_schema, use_threads=use_threads)
+    except pa.ArrowInvalid:
+        if explicit_schema is not None:
+            raise
+        # Arrow columns hold a single type, so fields changing type across records (e.g. from string to number)
+        # are loaded record by record into object columns instead
+        _logger.debug("Records could not be parsed by Arrow, decoding them one by one.")
+        return pd.DataFrame([json.loads(record) for record in buffer.to_pybytes().splitlines() if record])
+    return _table_to_df(table=table, use_threads=use_threads)
 
-    args: Dict[str, Any] = {
-        "Bucket": bucket,
-        "Key": key,
-        "Expression": sql,
-        "ExpressionType": "SQL",
-        "RequestProgress": {"Enabled": False},
-        "InputSerialization": {
-            input_serialization: input_serialization_params,
-            "CompressionType": compression.upper() if compression else "NONE",
-        },
-        "OutputSerialization": {
-            "JSON": {},
-        },
-    }
-    if s3_additional_kwargs:
-        args.update(s3_additional_kwargs)
-    _logger.debug("args:\n%s", pprint.pformat(args))
 
-    if any(
-        [
-            compression,
-            input_serialization_params.get("AllowQuotedRecordDelimiter"),
-            input_serialization_params.get("Type") == "Document",
-        ]
-    ):  # Scan range is only supported for uncompressed CSV/JSON, CSV (without quoted delimiters)
-        # and JSON objects (in LINES mode only)
-        _logger.debug("Scan ranges are not supported given provided input.")
-        return pd.DataFrame(_select_object_content(args=args, boto3_session=boto3_session))
-    return _paginate_stream(args=args, path=path, use_threads=use_threads, boto3_session=boto3_session)
+def select_query_arrow(
+    sql: str,
+    path: str,
+    input_serialization: str,
+    input_serialization_params: Dict[str, Union[bool, str]],
+    compression: Optional[str] = None,
+    scan_range_chunk_size: Optional[int] = None,
+    explicit_schema: Optional[pa.Schema] = None,
+    use_threads: Union[bool, int] = False,
+    boto3_session: Optional[boto3.Session] = None,
+    s3_additional_kwargs: Optional[Dict[str, Any]] = None,
+) -> pa.Table:
+    r"""Filter contents of an Amazon S3 object based on SQL statement and return an Arrow Table.
+
+    Same as `wr.s3.select_query` (see it for the parameters) but skips the conversion to pandas,
+    for consumers that can work on Arrow data directly. Fields changing type across records
+    (e.g. from string to number) can't be held by an Arrow Table, so they raise instead of
+    being returned as object columns.
+
+    Returns
+    -------
+    pyarrow.Table
+        Arrow Table with results from query.
+
+    Examples
+    --------
+    >>> import awswrangler as wr
+    >>> table = wr.s3.select_query_arrow(
+    ...     sql='SELECT * FROM s3object',
+    ...     path='s3://bucket/key.csv',
+    ...     input_serialization='CSV',
+    ...     input_serialization_params={
+    ...         'FileHeaderInfo': 'Use',
+    ...         'RecordDelimiter': '\r\n'
+    ...     },
+    ...     use_threads=True,
+    ... )
+    """
+    return _read_json(
+        buffer=_select_query(
+            sql=sql,
+            path=path,
+            input_serialization=input_serialization,
+            input_serialization_params=input_serialization_params,
+            compression=compression,
+            scan_range_chunk_size=scan_range_chunk_size,
+            explicit_schema=explicit_schema,
+            use_threads=use_threads,
+            boto3_session=boto3_session,
+            s3_additional_kwargs=s3_additional_kwargs,
+        ),
+        explicit_schema=explicit_schema,
+        use_threads=use_threads,
+    )
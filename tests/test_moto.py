@@ -421,6 +421,162 @@ def test_s3_raise_delete_object_exception_success(moto_s3):
             wr.s3.delete_objects(path=path)
 
 
+def _s3_select_query_mocked(path, use_threads, s3_additional_kwargs=None, input_serialization_params=None):
+    select_kwargs = []
+
+    call = botocore.client.BaseClient._make_api_call
+
+    def mock_make_api_call(self, operation_name, kwarg):
+        if operation_name == "SelectObjectContent":
+            select_kwargs.append(kwarg)
+            return {"Payload": [{"Records": {"Payload": b'{"c0":1}\n{"c0":2}\n{"c0":3}\n'}}, {"End": {}}]}
+        return call(self, operation_name, kwarg)
+
+    with mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call):
+        with mock.patch("awswrangler._utils.client", wraps=wr._utils.client) as mock_client:
+            df = wr.s3.select_query(
+                sql="select * from s3object",
+                path=path,
+                input_serialization="JSON",
+                input_serialization_params=input_serialization_params or {"Type": "Lines"},
+                use_threads=use_threads,
+                s3_additional_kwargs=s3_additional_kwargs,
+            )
+    assert df.c0.tolist() == [1, 2, 3]
+    return select_kwargs, mock_client
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_s3_select_query_botocore_config(moto_s3, use_threads):
+    path = "s3://bucket/test.json"
+    wr.s3.to_json(pd.DataFrame({"c0": [1, 2, 3]}), path, orient="records", lines=True)
+    botocore_config = botocore.config.Config(retries={"max_attempts": 3}, max_pool_connections=7)
+
+    select_kwargs, mock_client = _s3_select_query_mocked(
+        path=path,
+        use_threads=use_threads,
+        s3_additional_kwargs={"botocore_config": botocore_config, "ExpectedBucketOwner": "123456789012"},
+    )
+    assert len(select_kwargs) == 1
+    assert "botocore_config" not in select_kwargs[0]
+    assert select_kwargs[0]["ExpectedBucketOwner"] == "123456789012"
+    mock_client.assert_called_once_with(service_name="s3", session=None, botocore_config=botocore_config)
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+@pytest.mark.parametrize("input_serialization_params", [{"Type": "Lines"}, {"Type": "Document"}])
+def test_s3_select_query_global_botocore_config(moto_s3, use_threads, input_serialization_params):
+    path = "s3://bucket/test.json"
+    wr.s3.to_json(pd.DataFrame({"c0": [1, 2, 3]}), path, orient="records", lines=True)
+    client_configs = []
+
+    original = botocore.client.ClientCreator.create_client
+
+    def wrapper(self, **kwarg):
+        if kwarg["service_name"] == "s3":
+            client_configs.append(kwarg["client_config"])
+        return original(self, **kwarg)
+
+    wr.config.botocore_config = botocore.config.Config(connect_timeout=42, retries={"max_attempts": 3})
+    try:
+        with mock.patch("botocore.client.ClientCreator.create_client", new=wrapper):
+            _s3_select_query_mocked(
+                path=path, use_threads=use_threads, input_serialization_params=input_serialization_params
+            )
+    finally:
+        wr.config.reset()
+    assert len(client_configs) == 1
+    assert client_configs[0].connect_timeout == 42
+    if use_threads and input_serialization_params["Type"] == "Lines":
+        assert client_configs[0].max_pool_connections >= 50
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_s3_select_query_scan_ranges(moto_s3, use_threads):
+    path = "s3://bucket/test.json"
+    wr.s3.to_json(pd.DataFrame({"c0": list(range(100))}), path, orient="records", lines=True)
+    size = wr.s3.size_objects(path)[path]
+    select_kwargs = []
+
+    call = botocore.client.BaseClient._make_api_call
+
+    def mock_make_api_call(self, operation_name, kwarg):
+        if operation_name == "SelectObjectContent":
+            select_kwargs.append(kwarg)
+            return {"Payload": [{"End": {}}]}
+        return call(self, operation_name, kwarg)
+
+    with mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call):
+        wr.s3.select_query(
+            sql="select * from s3object",
+            path=path,
+            input_serialization="JSON",
+            input_serialization_params={"Type": "Lines"},
+            scan_range_chunk_size=100,
+            use_threads=use_threads,
+        )
+    # ScanRange End is inclusive, so ranges must cover the object without sharing any byte
+    scan_ranges = sorted((kwarg["ScanRange"]["Start"], kwarg["ScanRange"]["End"]) for kwarg in select_kwargs)
+    assert scan_ranges[0][0] == 0
+    assert scan_ranges[-1][1] == size - 1
+    assert all(end + 1 == start for (_, end), (start, _) in zip(scan_ranges, scan_ranges[1:]))
+
+
+@pytest.mark.parametrize("scan_range_chunk_size", [0, -1])
+def test_s3_select_query_invalid_scan_range_chunk_size(moto_s3, scan_range_chunk_size):
+    with pytest.raises(wr.exceptions.InvalidArgumentValue):
+        wr.s3.select_query(
+            sql="select * from s3object",
+            path="s3://bucket/test.json",
+            input_serialization="JSON",
+            input_serialization_params={"Type": "Lines"},
+            scan_range_chunk_size=scan_range_chunk_size,
+        )
+
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        (b'{"c0":"2020-01-01"}\n{"c0":"9999-12-31"}\n', ["2020-01-01", "9999-12-31"]),
+        (b'{"c0":"x"}\n{"c0":1}\n', ["x", 1]),
+    ],
+)
+def test_s3_select_query_default_types(moto_s3, payload, expected):
+    path = "s3://bucket/test.json"
+    wr.s3.to_json(pd.DataFrame({"c0": [1, 2, 3]}), path, orient="records", lines=True)
+
+    call = botocore.client.BaseClient._make_api_call
+
+    def mock_make_api_call(self, operation_name, kwarg):
+        if operation_name == "SelectObjectContent":
+            return {"Payload": [{"Records": {"Payload": payload}}, {"End": {}}]}
+        return call(self, operation_name, kwarg)
+
+    with mock.patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call):
+        df = wr.s3.select_query(
+            sql="select * from s3object",
+            path=path,
+            input_serialization="JSON",
+            input_serialization_params={"Type": "Lines"},
+        )
+    assert df.c0.tolist() == expected
+
+
+def test_s3_select_query_retries_from_environment(moto_s3, monkeypatch):
+    path = "s3://bucket/test.json"
+    wr.s3.to_json(pd.DataFrame({"c0": [1, 2, 3]}), path, orient="records", lines=True)
+
+    _, mock_client = _s3_select_query_mocked(path=path, use_threads=True)
+    assert mock_client.call_args[1]["botocore_config"].retries["mode"] == "adaptive"
+
+    monkeypatch.setenv("AWS_MAX_ATTEMPTS", "20")
+    monkeypatch.setenv("AWS_RETRY_MODE", "standard")
+    _, mock_client = _s3_select_query_mocked(path=path, use_threads=True)
+    botocore_config = mock_client.call_args[1]["botocore_config"]
+    assert botocore_config.retries["mode"] == "standard"
+    assert botocore_config.max_pool_connections >= 50
+
+
 def test_emr(moto_s3, moto_emr, moto_sts, moto_subnet):
     session = boto3.Session(region_name="us-west-1")
     cluster_id = wr.emr.create_cluster(
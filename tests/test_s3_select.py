@@ -2,6 +2,7 @@ import logging
 import sys
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import awswrangler as wr
@@ -164,3 +165,154 @@ def test_encryption(path, kms_key_id, s3_additional_kwargs):
         use_threads=False,
     )
     assert df.equals(df2)
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_scan_range_chunk_size(path, use_threads):
+    df = pd.DataFrame({"c0": list(range(1000)), "c1": ["foo"] * 1000})
+
+    file_path = f"{path}test_csv_file.csv"
+    wr.s3.to_csv(df, file_path, index=False)
+    df2 = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="CSV",
+        input_serialization_params={"FileHeaderInfo": "Use", "RecordDelimiter": "\n"},
+        scan_range_chunk_size=1024,
+        use_threads=use_threads,
+    )
+    assert df2.shape == df.shape
+    assert df2.c0.astype(int).sum() == df.c0.sum()
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_scan_range_record_boundaries(path, use_threads):
+    df = pd.DataFrame({"c0": list(range(500)), "c1": ["foo" * (i % 50) for i in range(500)]})
+
+    file_path = f"{path}test_json_file.json"
+    wr.s3.to_json(df, file_path, orient="records", lines=True)
+    df2 = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="JSON",
+        input_serialization_params={"Type": "Lines"},
+        scan_range_chunk_size=100,
+        use_threads=use_threads,
+    )
+    assert df.equals(df2.sort_values("c0").reset_index(drop=True))
+
+    # Fixed width records (14 bytes each), so every scan range boundary falls on the first byte of a record
+    df = pd.DataFrame({"c0": [f"{i:04d}" for i in range(500)]})
+    wr.s3.to_json(df, file_path, orient="records", lines=True)
+    df2 = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="JSON",
+        input_serialization_params={"Type": "Lines"},
+        scan_range_chunk_size=140,
+        use_threads=use_threads,
+    )
+    assert df2.c0.tolist() == df.c0.tolist()
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_scan_range_type_resolution(path, use_threads):
+    df = pd.DataFrame(
+        {
+            "c0": pd.Series(list(range(100)) + [i + 0.5 for i in range(100)], dtype=object),
+            "c1": ["2020-01-01"] * 100 + ["N/A"] * 100,
+        }
+    )
+
+    # Integral values in the first scan ranges, fractional values in the last ones
+    file_path = f"{path}test_json_file.json"
+    wr.s3.to_json(df[["c0"]], file_path, orient="records", lines=True)
+    df2 = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="JSON",
+        input_serialization_params={"Type": "Lines"},
+        scan_range_chunk_size=256,
+        use_threads=use_threads,
+    )
+    assert str(df2.c0.dtype) == "float64"
+    assert df2.c0.sum() == df.c0.sum()
+
+    # Date-like strings in the first scan ranges, plain strings in the last ones
+    file_path = f"{path}test_csv_file.csv"
+    wr.s3.to_csv(df[["c1"]], file_path, index=False)
+    df3 = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="CSV",
+        input_serialization_params={"FileHeaderInfo": "Use", "RecordDelimiter": "\n"},
+        scan_range_chunk_size=256,
+        use_threads=use_threads,
+    )
+    assert str(df3.c1.dtype) == "object"
+    assert df3.c1.tolist() == df.c1.tolist()
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_date_strings(path, use_threads):
+    df = pd.DataFrame({"c0": ["2020-01-01", "2021-06-30", "9999-12-31"] * 100})
+    file_path = f"{path}test_csv_file.csv"
+    wr.s3.to_csv(df, file_path, index=False)
+    df2 = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="CSV",
+        input_serialization_params={"FileHeaderInfo": "Use", "RecordDelimiter": "\n"},
+        scan_range_chunk_size=256,
+        use_threads=use_threads,
+    )
+    assert str(df2.c0.dtype) == "object"
+    assert df2.c0.tolist() == df.c0.tolist()
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_mixed_types(path, use_threads):
+    file_path = f"{path}test_json_file.json"
+    wr.s3.to_json(pd.DataFrame({"c0": pd.Series(["x", 1], dtype=object)}), file_path, orient="records", lines=True)
+    df = wr.s3.select_query(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="JSON",
+        input_serialization_params={"Type": "Lines"},
+        use_threads=use_threads,
+    )
+    assert df.c0.tolist() == ["x", 1]
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_explicit_schema(path, use_threads):
+    df = pd.DataFrame({"c0": [1, 2, 3], "c1": ["foo", "boo", "bar"], "c2": [4.0, 5.0, 6.0]})
+
+    file_path = f"{path}test_csv_file.csv"
+    wr.s3.to_csv(df, file_path, index=False)
+    df2 = wr.s3.select_query(
+        sql='select cast(s."c0" as int) as c0, s."c1" from s3object s',
+        path=file_path,
+        input_serialization="CSV",
+        input_serialization_params={"FileHeaderInfo": "Use", "RecordDelimiter": "\n"},
+        explicit_schema=pa.schema([("c0", pa.int64()), ("c1", pa.string())]),
+        use_threads=use_threads,
+    )
+    assert df[["c0", "c1"]].equals(df2)
+
+
+@pytest.mark.parametrize("use_threads", [True, False])
+def test_select_query_arrow(path, use_threads):
+    df = pd.DataFrame({"c0": [1, 2, 3], "c1": ["foo", "boo", "bar"], "c2": [4.0, 5.0, 6.0]})
+
+    file_path = f"{path}test_parquet_file.snappy.parquet"
+    wr.s3.to_parquet(df, file_path, compression="snappy")
+    table = wr.s3.select_query_arrow(
+        sql="select * from s3object",
+        path=file_path,
+        input_serialization="Parquet",
+        input_serialization_params={},
+        use_threads=use_threads,
+    )
+    assert isinstance(table, pa.Table)
+    assert df.equals(table.to_pandas())